@@ -10,19 +10,218 @@ Date: February 2026
 Course: Cloud DevOps Training
 """
 
-import json
 import boto3
 import time
 import os
+import logging
+from botocore.config import Config
+from botocore.exceptions import ClientError, HTTPClientError
+from botocore.exceptions import ConnectionError as BotoConnectionError
+
+# SnapStart runtime hooks ship with the managed Python runtimes (3.12+) whether
+# or not SnapStart is enabled, so a successful import does not mean SnapStart is
+# active - the hooks only fire for SnapStart-enabled versions
+try:
+    from snapshot_restore_py import register_before_snapshot
+except ImportError:
+    register_before_snapshot = None
+
+# orjson is faster than the stdlib json module; fall back to json when the
+# function is deployed without the orjson package/layer
+try:
+    import orjson
+
+    def to_json(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:
+    import json
+
+    def to_json(obj):
+        return json.dumps(obj)
+
+# Shared client configuration: standard retry mode with a low attempt cap,
+# short timeouts and kept-alive pooled connections reused across invocations
+AWS_CLIENT_CONFIG = Config(
+    retries={'mode': 'standard', 'max_attempts': 2},
+    max_pool_connections=10,
+    tcp_keepalive=True,
+    connect_timeout=2,
+    read_timeout=3
+)
+
+# The account-level check runs before remediation, so it gets a single attempt
+# and tight timeouts - a slow S3 Control endpoint falls back to the per-bucket
+# checks instead of delaying the lockdown
+ACCOUNT_CHECK_CONFIG = AWS_CLIENT_CONFIG.merge(Config(
+    retries={'mode': 'standard', 'max_attempts': 1},
+    connect_timeout=0.5,
+    read_timeout=1
+))
 
 # Initialize AWS SDK clients
-s3 = boto3.client('s3')
-sns = boto3.client('sns')
+# The SNS/SQS clients are only needed when an alert is sent, and the S3 Control
+# client only once per execution environment, so they are created lazily
+s3 = boto3.client('s3', config=AWS_CLIENT_CONFIG)
+s3control = None
+sns = None
+sqs = None
+
+# Logging: set LOG_LEVEL=DEBUG on the function to include full event payloads
+logger = logging.getLogger()
+logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO'))
 
 # Configuration: SNS Topic ARN for security alerts
 # IMPORTANT: Replace this with your actual SNS Topic ARN
 SNS_TOPIC_ARN = os.environ.get('SNS_TOPIC_ARN', 'arn:aws:sns:us-east-1:YOUR-ACCOUNT-ID:MyFirstAlert')
 
+# Optional: SQS queue URL for batched alerts. When set, remediation alerts are
+# queued and emailed as a digest by digest_function.py instead of one SNS
+# email per bucket.
+ALERT_QUEUE_URL = os.environ.get('ALERT_QUEUE_URL')
+
+# Retry settings for buckets that S3 does not report as ready yet
+BUCKET_NOT_READY_CODES = ('NoSuchBucket', 'OperationAborted')
+BUCKET_READY_MAX_ATTEMPTS = 5
+BUCKET_READY_BASE_DELAY = 0.1  # seconds, doubled on each retry
+
+# The 4 public access block settings - a bucket is secure only if all are enabled
+PUBLIC_ACCESS_BLOCK_SETTINGS = (
+    'BlockPublicAcls',
+    'IgnorePublicAcls',
+    'BlockPublicPolicy',
+    'RestrictPublicBuckets'
+)
+
+# Error codes worth retrying the whole event for (in addition to any 5xx)
+TRANSIENT_ERROR_CODES = (
+    'Throttling',
+    'ThrottlingException',
+    'SlowDown',
+    'RequestLimitExceeded',
+    'TooManyRequestsException',
+    'RequestTimeout',
+    'RequestTimeoutException',
+    'PriorRequestNotComplete',
+    'OperationAborted'
+)
+
+# Account-level public access block, re-checked every ACCOUNT_PAB_TTL_SECONDS
+# (time.monotonic() timestamp of the last check)
+account_pab_checked_at = None
+account_protected = False
+ACCOUNT_PAB_TTL_SECONDS = 300
+
+# Buckets secured recently by this execution environment (bucket name ->
+# time.monotonic() timestamp). Used to skip duplicate CreateBucket events from
+# CloudTrail redelivery or tool retries.
+recently_secured = {}
+DEDUP_TTL_SECONDS = 60
+DEDUP_MAX_ENTRIES = 512
+
+# Configuration applied to public buckets: every public access block setting ON
+PUBLIC_ACCESS_BLOCK_LOCKDOWN = {
+    'BlockPublicAcls': True,        # Block new public ACLs
+    'IgnorePublicAcls': True,       # Ignore existing public ACLs
+    'BlockPublicPolicy': True,      # Block new public policies
+    'RestrictPublicBuckets': True   # Restrict public access via policies
+}
+
+# Static handler responses, shared across invocations (never mutate these).
+# EventBridge does not read the response body, so it is kept minimal.
+OK_RESPONSE = {'statusCode': 200, 'body': 'ok'}
+WARM_RESPONSE = {'statusCode': 200, 'body': 'warm'}
+NO_BUCKET_RESPONSE = {'statusCode': 200, 'body': 'No bucket to check'}
+
+# Alert email templates, filled in with str.format()
+ALERT_SUBJECT_FIXED = "🚨 Ghost Protocol: Public S3 Bucket FIXED"
+ALERT_MESSAGE_FIXED = """
+🚨 GHOST PROTOCOL SECURITY ALERT 🚨
+
+VIOLATION DETECTED AND FIXED!
+
+Bucket Details:
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+• Bucket Name: {bucket_name}
+• Issue: Bucket was created WITHOUT public access protection
+• Severity: HIGH
+• Status: ✅ REMEDIATED
+
+Actions Taken:
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+✅ All public access has been BLOCKED
+✅ Bucket is now SECURE
+✅ No data was exposed
+
+This bucket is now protected by:
+• BlockPublicAcls: ON
+• IgnorePublicAcls: ON
+• BlockPublicPolicy: ON
+• RestrictPublicBuckets: ON
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+⚡ Automated by Ghost Protocol Security System
+🕐 Response time: < 5 seconds
+"""
+
+ALERT_SUBJECT_CHECK = "⚠️ Ghost Protocol: Security Check"
+ALERT_MESSAGE_CHECK = """
+Ghost Protocol Security Check
+
+Bucket: {bucket_name}
+Status: Monitoring
+
+This is a routine security check.
+"""
+
+ALERT_SUBJECT_ERROR = '⚠️ Ghost Protocol System Error'
+ALERT_MESSAGE_ERROR = """
+⚠️ GHOST PROTOCOL ERROR ALERT ⚠️
+
+An error occurred in the Ghost Protocol security system:
+
+Error Details:
+{error_message}
+
+Please check CloudWatch Logs for more information:
+Log Group: /aws/lambda/GhostProtocol-S3-Monitor
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+This requires manual investigation.
+"""
+
+
+def load_s3_operation_models():
+    """
+    Build the S3 operation models the handler uses
+    
+    botocore builds operation models lazily on their first call. Doing it
+    during init moves that work off the first event. No network calls are
+    made.
+    """
+    for operation_name in ('GetPublicAccessBlock', 'PutPublicAccessBlock'):
+        s3.meta.service_model.operation_model(operation_name)
+
+
+def prime_clients():
+    """
+    Load everything the AWS clients need before a SnapStart snapshot
+    
+    Also creates the lazy SNS client, which is free to keep in a snapshot.
+    No network calls are made, so no connections end up in the snapshot.
+    """
+    load_s3_operation_models()
+    get_sns_client().meta.service_model.operation_model('Publish')
+
+
+# Lambda sets AWS_LAMBDA_INITIALIZATION_TYPE to 'snap-start' while building a
+# SnapStart snapshot
+SNAPSTART_ACTIVE = os.environ.get('AWS_LAMBDA_INITIALIZATION_TYPE') == 'snap-start'
+
+if SNAPSTART_ACTIVE and register_before_snapshot is not None:
+    register_before_snapshot(prime_clients)
+else:
+    load_s3_operation_models()
+
 
 def lambda_handler(event, context):
     """
@@ -36,100 +235,215 @@ def lambda_handler(event, context):
         context: Lambda context object
         
     Returns:
-        dict: Status code and message indicating success/failure
+        dict: Status code and body ('ok' for private buckets, the bucket
+              name for remediated buckets, 'No bucket to check' for events
+              without a bucket name)
+              
+    Raises:
+        Exception: Transient failures (throttling, 5xx, timeouts), after the
+                   error alert is sent, so that Lambda retries the event
     """
     
-    print(f"🔍 Ghost Protocol activated!")
-    print(f"Event received: {json.dumps(event, indent=2)}")
+    # Keep-warm ping from the scheduled warmer rule - nothing to check
+    if event.get('source') == 'warmer':
+        return WARM_RESPONSE
+    
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Event received: %s", to_json(event))
+    
+    # Everything about this invocation goes into a single structured log line
+    started = time.monotonic()
+    log_record = {'bucket': None, 'event': None, 'public': None, 'action': None}
     
     try:
         # Extract the S3 bucket name from the CloudTrail event
         bucket_name = extract_bucket_name(event)
+        event_name = (event.get('detail') or {}).get('eventName')
+        log_record['bucket'] = bucket_name
+        log_record['event'] = event_name
         
         if not bucket_name:
-            print("⚠️ Could not extract bucket name from event")
-            return {
-                'statusCode': 200,
-                'body': json.dumps('No bucket to check')
-            }
+            # Not an event from the EventBridge rule (e.g. a console test
+            # event) - nothing to check and nothing to alert about
+            log_record['action'] = 'ignored'
+            return NO_BUCKET_RESPONSE
         
-        print(f"📦 Checking bucket: {bucket_name}")
+        if is_account_protected(context):
+            # Account-level settings already block public access for every bucket
+            log_record['action'] = 'account_protected'
+            return OK_RESPONSE
         
-        # Small delay to ensure bucket is fully created before checking
-        time.sleep(2)
+        if event_name == 'CreateBucket' and was_recently_secured(bucket_name):
+            log_record['action'] = 'duplicate_skipped'
+            return OK_RESPONSE
         
-        # Check if the bucket has public access enabled
+        # Check the current state for every event, including CreateBucket:
+        # S3 enables Block Public Access on new buckets by default, so an
+        # alert is only sent when a violation was actually observed
         is_public = check_if_bucket_is_public(bucket_name)
+        log_record['public'] = is_public
         
         if is_public:
-            print(f"🚨 SECURITY ALERT: Bucket {bucket_name} is PUBLIC!")
-            
             # Remediate: Block all public access
             block_public_access(bucket_name)
+            mark_secured(bucket_name)
             
             # Send security alert via email
             send_security_alert(bucket_name, violation_fixed=True)
             
+            log_record['action'] = 'remediated'
             return {
                 'statusCode': 200,
-                'body': json.dumps(f'✅ Secured public bucket: {bucket_name}')
+                'body': bucket_name
             }
         else:
-            print(f"✅ Bucket {bucket_name} is already private - no action needed")
-            return {
-                'statusCode': 200,
-                'body': json.dumps(f'Bucket {bucket_name} is secure')
-            }
+            log_record['action'] = 'none'
+            return OK_RESPONSE
     
     except Exception as e:
         error_msg = f"Error processing event: {str(e)}"
-        print(f"❌ {error_msg}")
+        log_record['action'] = 'error'
+        log_record['error'] = error_msg
         send_error_alert(error_msg)
+        
+        if is_transient_error(e):
+            # Re-raise so Lambda's asynchronous retries run the event again
+            # (e.g. S3 throttling or 5xx while checking a changed bucket)
+            raise
+        
+        # Permanent failures (AccessDenied, NoSuchBucket, invalid parameters)
+        # would fail the same way on every retry
         return {
             'statusCode': 500,
-            'body': json.dumps(error_msg)
+            'body': error_msg
         }
+    
+    finally:
+        log_record['duration_ms'] = round((time.monotonic() - started) * 1000, 1)
+        if log_record['action'] == 'error':
+            logger.error(to_json(log_record))
+        else:
+            logger.info(to_json(log_record))
 
 
 def extract_bucket_name(event):
     """
     Extract S3 bucket name from EventBridge/CloudTrail event
     
-    EventBridge events have different structures depending on the S3 API call.
-    This function handles multiple event types (CreateBucket, PutBucketPublicAccessBlock, etc.)
+    The EventBridge rule (event_pattern.json) only matches events that carry
+    requestParameters.bucketName. Other events (e.g. the console's default
+    test event) have no bucket name.
     
     Args:
         event: EventBridge event dictionary
         
     Returns:
-        str: Bucket name, or None if not found
+        str: Bucket name, or None if the event has no bucket name
     """
-    try:
-        # EventBridge passes CloudTrail events in the 'detail' field
-        detail = event.get('detail', {})
-        
-        # Try to extract from request parameters (CreateBucket events)
-        request_parameters = detail.get('requestParameters', {})
-        
-        if 'bucketName' in request_parameters:
-            return request_parameters['bucketName']
-        
-        # Try to extract from response elements (other events)
-        response_elements = detail.get('responseElements', {})
-        if 'bucketName' in response_elements:
-            return response_elements['bucketName']
-        
-        # Check event name for bucket operations
-        event_name = detail.get('eventName', '')
-        if event_name == 'CreateBucket' and 'bucketName' in request_parameters:
-            return request_parameters['bucketName']
+    # EventBridge passes CloudTrail events in the 'detail' field.
+    # CloudTrail sends null for empty sections, hence the "or {}".
+    detail = event.get('detail') or {}
+    return (detail.get('requestParameters') or {}).get('bucketName')
+
+
+def is_transient_error(error):
+    """
+    Check if an error is temporary, so retrying the event may succeed
+    
+    Looks at the error and at the error it was raised from (e.g. the
+    ClientError wrapped by block_public_access).
+    
+    Args:
+        error: Exception raised while processing the event
         
-        print(f"⚠️ Could not find bucket name in event structure")
-        return None
+    Returns:
+        bool: True for throttling, 5xx responses, timeouts and connection errors
+    """
+    for candidate in (error, error.__cause__):
+        if isinstance(candidate, (BotoConnectionError, HTTPClientError)):
+            return True
+        if isinstance(candidate, ClientError):
+            error_code = candidate.response.get('Error', {}).get('Code')
+            status_code = candidate.response.get('ResponseMetadata', {}).get('HTTPStatusCode', 0)
+            return error_code in TRANSIENT_ERROR_CODES or status_code >= 500
+    return False
+
+
+def is_account_protected(context):
+    """
+    Check if the account-level public access block is fully enabled
+    
+    When all 4 settings are ON for the account, S3 enforces them on every
+    bucket and per-bucket remediation is redundant. The result is cached for
+    ACCOUNT_PAB_TTL_SECONDS so that turning account-level protection off is
+    picked up by warm execution environments. Any failure (missing
+    configuration, AccessDenied, timeouts) counts as "not protected" and is
+    cached too, so the per-bucket checks always run in that case. The lookup
+    uses ACCOUNT_CHECK_CONFIG, so it adds at most ~1.5s to a cold start.
+    
+    Args:
+        context: Lambda context object (used to find the account ID)
         
+    Returns:
+        bool: True if the whole account is protected
+    """
+    global s3control, account_pab_checked_at, account_protected
+    now = time.monotonic()
+    if account_pab_checked_at is not None and now - account_pab_checked_at < ACCOUNT_PAB_TTL_SECONDS:
+        return account_protected
+    
+    try:
+        if s3control is None:
+            s3control = boto3.client('s3control', config=ACCOUNT_CHECK_CONFIG)
+        account_id = context.invoked_function_arn.split(':')[4]
+        response = s3control.get_public_access_block(AccountId=account_id)
+        config = response['PublicAccessBlockConfiguration']
+        account_protected = all(config.get(setting) for setting in PUBLIC_ACCESS_BLOCK_SETTINGS)
     except Exception as e:
-        print(f"Error extracting bucket name: {str(e)}")
-        return None
+        # NoSuchPublicAccessBlockConfiguration means account-level protection
+        # is off; anything else just means we cannot rely on it
+        logger.debug("Account public access block not enabled or not readable: %s", e)
+        account_protected = False
+    
+    account_pab_checked_at = now
+    return account_protected
+
+
+def was_recently_secured(bucket_name):
+    """
+    Check if this execution environment secured the bucket within DEDUP_TTL_SECONDS
+    
+    Only used for CreateBucket events: a repeated CreateBucket for an existing
+    bucket cannot change its public access settings, so it is safe to skip.
+    Public access block changes are always checked.
+    
+    Args:
+        bucket_name: Name of the S3 bucket
+        
+    Returns:
+        bool: True if the bucket was secured recently
+    """
+    secured_at = recently_secured.get(bucket_name)
+    return secured_at is not None and time.monotonic() - secured_at < DEDUP_TTL_SECONDS
+
+
+def mark_secured(bucket_name):
+    """
+    Remember that a bucket was just secured, pruning expired entries
+    
+    Args:
+        bucket_name: Name of the S3 bucket
+    """
+    global recently_secured
+    now = time.monotonic()
+    
+    if len(recently_secured) >= DEDUP_MAX_ENTRIES:
+        recently_secured = {
+            name: secured_at for name, secured_at in recently_secured.items()
+            if now - secured_at < DEDUP_TTL_SECONDS
+        }
+    
+    recently_secured[bucket_name] = now
 
 
 def check_if_bucket_is_public(bucket_name):
@@ -149,34 +463,65 @@ def check_if_bucket_is_public(bucket_name):
         
     Returns:
         bool: True if bucket is public (insecure), False if private (secure)
+        
+    Raises:
+        ClientError: If S3 fails for a reason other than a missing
+                     configuration or denied access
     """
     try:
         # Get the public access block configuration
-        try:
-            response = s3.get_public_access_block(Bucket=bucket_name)
-            config = response['PublicAccessBlockConfiguration']
-            
-            # Check if all 4 security settings are enabled
-            if (config['BlockPublicAcls'] and 
-                config['IgnorePublicAcls'] and 
-                config['BlockPublicPolicy'] and 
-                config['RestrictPublicBuckets']):
-                
-                print(f"✅ All public access blocks are enabled - bucket is SECURE")
-                return False  # Bucket is private (secure)
-            else:
-                print(f"⚠️ Some public access blocks are disabled - bucket is PUBLIC")
-                return True  # Bucket is public (insecure)
-                
-        except s3.exceptions.NoSuchPublicAccessBlockConfiguration:
+        response = call_when_bucket_ready(s3.get_public_access_block, bucket_name)
+    except ClientError as e:
+        error_code = e.response['Error']['Code']
+        
+        if error_code == 'NoSuchPublicAccessBlockConfiguration':
             # No configuration means bucket might be public (no protection)
-            print(f"⚠️ No public access block configuration found - assuming PUBLIC")
             return True
-            
-    except Exception as e:
-        print(f"Error checking bucket public access: {str(e)}")
-        # If we can't check, assume it's public (fail secure)
-        return True
+        
+        if error_code == 'AccessDenied':
+            # If we are not allowed to check, assume it's public (fail secure)
+            logger.debug("Access denied checking bucket public access: %s", e)
+            return True
+        
+        # Anything else (e.g. throttling or 5xx after botocore's retries)
+        # is re-raised by the handler so Lambda retries the event, instead
+        # of triggering a remediation
+        raise
+    
+    config = response['PublicAccessBlockConfiguration']
+    
+    # Check if all 4 security settings are enabled (stops at the first disabled one)
+    # True means bucket is public (insecure), False means private (secure)
+    return not all(config.get(setting) for setting in PUBLIC_ACCESS_BLOCK_SETTINGS)
+
+
+def call_when_bucket_ready(s3_call, bucket_name, **kwargs):
+    """
+    Call an S3 bucket API, waiting for newly created buckets
+    
+    CloudTrail can deliver the CreateBucket event before the bucket is visible
+    to every S3 endpoint. Instead of always sleeping, retry with exponential
+    backoff only when S3 reports that the bucket is not ready yet.
+    
+    Args:
+        s3_call: S3 client method to call (e.g. s3.get_public_access_block)
+        bucket_name: Name of the S3 bucket
+        **kwargs: Extra parameters passed to the S3 call
+        
+    Returns:
+        dict: Response from the S3 call
+    """
+    for attempt in range(BUCKET_READY_MAX_ATTEMPTS):
+        try:
+            return s3_call(Bucket=bucket_name, **kwargs)
+        except ClientError as e:
+            error_code = e.response['Error']['Code']
+            is_last_attempt = attempt == BUCKET_READY_MAX_ATTEMPTS - 1
+            if error_code not in BUCKET_NOT_READY_CODES or is_last_attempt:
+                raise
+            delay = BUCKET_READY_BASE_DELAY * (2 ** attempt)
+            logger.debug("⏳ Bucket %s not ready (%s) - retrying in %.1fs", bucket_name, error_code, delay)
+            time.sleep(delay)
 
 
 def block_public_access(bucket_name):
@@ -193,29 +538,47 @@ def block_public_access(bucket_name):
         bucket_name: Name of the S3 bucket to secure
         
     Raises:
-        Exception: If remediation fails (propagated to caller)
+        Exception: If S3 rejects the remediation (propagated to caller)
     """
     try:
-        print(f"🔧 Remediating bucket: {bucket_name}...")
-        print(f"   Enabling all public access blocks...")
-        
         # Apply comprehensive public access block configuration
-        s3.put_public_access_block(
-            Bucket=bucket_name,
-            PublicAccessBlockConfiguration={
-                'BlockPublicAcls': True,        # Block new public ACLs
-                'IgnorePublicAcls': True,       # Ignore existing public ACLs
-                'BlockPublicPolicy': True,      # Block new public policies
-                'RestrictPublicBuckets': True   # Restrict public access via policies
-            }
+        call_when_bucket_ready(
+            s3.put_public_access_block,
+            bucket_name,
+            PublicAccessBlockConfiguration=PUBLIC_ACCESS_BLOCK_LOCKDOWN
         )
         
-        print(f"✅ Successfully blocked all public access on {bucket_name}")
-        
-    except Exception as e:
-        error_msg = f"Failed to remediate {bucket_name}: {str(e)}"
-        print(f"❌ {error_msg}")
-        raise Exception(error_msg)
+    except ClientError as e:
+        raise Exception(f"Failed to remediate {bucket_name}: {str(e)}") from e
+
+
+def get_sns_client():
+    """
+    Return the SNS client, creating it on first use
+    
+    The client is cached at module level so it is reused by later
+    invocations in the same execution environment.
+    
+    Returns:
+        SNS boto3 client
+    """
+    global sns
+    if sns is None:
+        sns = boto3.client('sns', config=AWS_CLIENT_CONFIG)
+    return sns
+
+
+def get_sqs_client():
+    """
+    Return the SQS client, creating it on first use
+    
+    Returns:
+        SQS boto3 client
+    """
+    global sqs
+    if sqs is None:
+        sqs = boto3.client('sqs', config=AWS_CLIENT_CONFIG)
+    return sqs
 
 
 def send_security_alert(bucket_name, violation_fixed=False):
@@ -227,63 +590,79 @@ def send_security_alert(bucket_name, violation_fixed=False):
     - Actions taken (remediation steps)
     - Security status after remediation
     
+    If ALERT_QUEUE_URL is configured, remediation alerts are queued for the
+    digest function instead of being emailed individually.
+    
+    The publish is synchronous: Lambda freezes background threads when the
+    handler returns, so an alert still in flight could be lost.
+    
     Args:
         bucket_name: Name of the bucket with violation
         violation_fixed: Whether remediation was successful
     """
     try:
         if violation_fixed:
-            subject = "🚨 Ghost Protocol: Public S3 Bucket FIXED"
-            message = f"""
-🚨 GHOST PROTOCOL SECURITY ALERT 🚨
-
-VIOLATION DETECTED AND FIXED!
-
-Bucket Details:
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-• Bucket Name: {bucket_name}
-• Issue: Bucket was created WITHOUT public access protection
-• Severity: HIGH
-• Status: ✅ REMEDIATED
-
-Actions Taken:
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-✅ All public access has been BLOCKED
-✅ Bucket is now SECURE
-✅ No data was exposed
-
-This bucket is now protected by:
-• BlockPublicAcls: ON
-• IgnorePublicAcls: ON
-• BlockPublicPolicy: ON
-• RestrictPublicBuckets: ON
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-⚡ Automated by Ghost Protocol Security System
-🕐 Response time: < 5 seconds
-"""
+            subject = ALERT_SUBJECT_FIXED
+            message = ALERT_MESSAGE_FIXED.format(bucket_name=bucket_name)
         else:
-            subject = "⚠️ Ghost Protocol: Security Check"
-            message = f"""
-Ghost Protocol Security Check
+            subject = ALERT_SUBJECT_CHECK
+            message = ALERT_MESSAGE_CHECK.format(bucket_name=bucket_name)
+        
+        if ALERT_QUEUE_URL and violation_fixed:
+            queue_alert(get_sqs_client(), bucket_name)
+        else:
+            publish_alert(get_sns_client(), subject, message)
+        
+    except Exception as e:
+        logger.error("❌ Failed to send SNS alert: %s", e)
 
-Bucket: {bucket_name}
-Status: Monitoring
 
-This is a routine security check.
-"""
-        
-        # Publish to SNS topic
-        response = sns.publish(
+def publish_alert(sns_client, subject, message):
+    """
+    Publish a security alert to the SNS topic
+    
+    Errors are logged here instead of being raised, so a failed alert
+    never undoes a successful remediation.
+    
+    Args:
+        sns_client: SNS boto3 client
+        subject: Email subject line
+        message: Email body
+    """
+    try:
+        response = sns_client.publish(
             TopicArn=SNS_TOPIC_ARN,
             Subject=subject,
             Message=message
         )
         
-        print(f"📧 Alert sent successfully! MessageId: {response['MessageId']}")
+        logger.debug("📧 Alert sent successfully! MessageId: %s", response['MessageId'])
+        
+    except Exception as e:
+        logger.error("❌ Failed to send SNS alert: %s", e)
+
+
+def queue_alert(sqs_client, bucket_name):
+    """
+    Queue a remediation alert for the digest function
+    
+    Errors are logged here instead of being raised, so a failed alert
+    never undoes a successful remediation.
+    
+    Args:
+        sqs_client: SQS boto3 client
+        bucket_name: Name of the remediated bucket
+    """
+    try:
+        response = sqs_client.send_message(
+            QueueUrl=ALERT_QUEUE_URL,
+            MessageBody=to_json({'bucket': bucket_name, 'ts': time.time()})
+        )
+        
+        logger.debug("📨 Alert queued for digest! MessageId: %s", response['MessageId'])
         
     except Exception as e:
-        print(f"❌ Failed to send SNS alert: {str(e)}")
+        logger.error("❌ Failed to queue alert: %s", e)
 
 
 def send_error_alert(error_message):
@@ -297,26 +676,13 @@ def send_error_alert(error_message):
         error_message: Description of the error that occurred
     """
     try:
-        message = f"""
-⚠️ GHOST PROTOCOL ERROR ALERT ⚠️
-
-An error occurred in the Ghost Protocol security system:
-
-Error Details:
-{error_message}
-
-Please check CloudWatch Logs for more information:
-Log Group: /aws/lambda/GhostProtocol-S3-Monitor
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-This requires manual investigation.
-"""
+        message = ALERT_MESSAGE_ERROR.format(error_message=error_message)
         
-        sns.publish(
+        get_sns_client().publish(
             TopicArn=SNS_TOPIC_ARN,
-            Subject='⚠️ Ghost Protocol System Error',
+            Subject=ALERT_SUBJECT_ERROR,
             Message=message
         )
         
     except Exception as e:
-        print(f"❌ Could not send error alert: {str(e)}")
+        logger.error("❌ Could not send error alert: %s", e)